@@ -2,8 +2,8 @@
 File Categories Module
 Defines the categories and file extensions for the File Sorter application.
 """
-import os
-from typing import Dict, List, Set, Optional
+import functools
+from typing import Dict, List, Set, Optional, Tuple
 
 class FileCategories:
     """Manages file categories and their associated extensions."""
@@ -29,12 +29,32 @@ class FileCategories:
         self.extension_map = {}
         self._build_extension_map()
         
+        # Memoized extension lookup; files in one folder share few extensions
+        self._category_for_ext = functools.lru_cache(maxsize=128)(self._lookup_extension)
+        
     def _build_extension_map(self):
         """Build a mapping of extensions to categories for quick lookups."""
-        self.extension_map = {}
-        for category, extensions in self.categories.items():
-            for ext in extensions:
-                self.extension_map[ext.lower()] = category
+        # Categories without extensions (like "Others") contribute nothing
+        self.extension_map = {
+            ext.lower(): category
+            for category, extensions in self.categories.items() if extensions
+            for ext in extensions
+        }
+        
+        # Trie over reversed extensions for longest-suffix matching of
+        # multi-dot extensions such as ".tar.gz"
+        self._suffix_trie = {}
+        for ext, category in self.extension_map.items():
+            node = self._suffix_trie
+            for char in reversed(ext):
+                node = node.setdefault(char, {})
+            node[""] = category
+        self._known_exts = frozenset(self.extension_map)
+        self._has_multi_dot_exts = any(ext.count('.') > 1 for ext in self.extension_map)
+        
+        # Cache the category names and a zeroed stats template
+        self._cached_categories = tuple(self.categories.keys())
+        self._empty_stats = dict.fromkeys(self._cached_categories, 0)
     
     def get_category_for_file(self, filename: str) -> str:
         """Determine the category for a given filename based on its extension.
@@ -45,23 +65,83 @@ class FileCategories:
         Returns:
             The category name for the file
         """
-        _, ext = os.path.splitext(filename)
+        if self._has_multi_dot_exts:
+            return self._match_longest_suffix(filename)
+        
+        # Find the extension without going through os.path.splitext
+        dot = filename.rfind('.')
+        if dot <= 0:
+            return "Others"
+        return self._category_for_ext(filename[dot:])
+    
+    def categorize_batch(self, filenames: List[str]) -> List[str]:
+        """Determine the categories for many filenames at once.
+        
+        Args:
+            filenames: The names of the files to categorize
+            
+        Returns:
+            List of category names, in the same order as filenames
+        """
+        return list(map(self.get_category_for_file, filenames))
+    
+    def _match_longest_suffix(self, filename: str) -> str:
+        """Find the category of the longest configured extension ending filename.
+        
+        Walks the reversed-extension trie from the end of the name, so each
+        lookup costs at most one step per character of the longest extension.
+        
+        Args:
+            filename: The name of the file to categorize
+            
+        Returns:
+            The category name for the file
+        """
+        name = filename.lower()
+        node = self._suffix_trie
+        category = "Others"
+        
+        # Stop before the first character so a bare ".ext" name has no extension
+        for i in range(len(name) - 1, 0, -1):
+            node = node.get(name[i])
+            if node is None:
+                break
+            if "" in node:
+                category = node[""]
+        
+        return category
+    
+    def _lookup_extension(self, ext: str) -> str:
+        """Look up the category for an extension as it appears in a filename.
+        
+        Args:
+            ext: The extension including the leading dot, in any case
+            
+        Returns:
+            The category name, or "Others" for unknown extensions
+        """
         ext = ext.lower()
         
-        # Return the category if the extension is known
-        if ext in self.extension_map:
+        # Unknown extensions go straight to "Others" after one set probe
+        if ext in self._known_exts:
             return self.extension_map[ext]
-        
-        # Return "Others" for unknown extensions
         return "Others"
     
-    def get_all_categories(self) -> List[str]:
-        """Get a list of all category names.
+    def get_all_categories(self) -> Tuple[str, ...]:
+        """Get all category names.
+        
+        Returns:
+            Tuple of category names
+        """
+        return self._cached_categories
+    
+    def get_empty_stats(self) -> Dict[str, int]:
+        """Get a fresh statistics dictionary with every category set to zero.
         
         Returns:
-            List of category names
+            Dictionary mapping category names to 0
         """
-        return list(self.categories.keys())
+        return self._empty_stats.copy()
     
     def get_extensions_for_category(self, category: str) -> List[str]:
         """Get all extensions for a specific category.
@@ -85,8 +165,9 @@ class FileCategories:
         for category, extensions in custom_categories.items():
             self.categories[category] = extensions
         
-        # Rebuild the extension map
+        # Rebuild the extension map and drop memoized lookups
         self._build_extension_map()
+        self._category_for_ext.cache_clear()
     
     def get_custom_categories(self) -> Dict[str, List[str]]:
         """Get the current categories configuration.
@@ -3,12 +3,22 @@ File Operations Module
 Handles file operations for the File Sorter application.
 """
 import os
+import errno
 import shutil
 import logging
-from typing import List, Tuple, Dict, Optional, Any
+from concurrent.futures import ThreadPoolExecutor
+from typing import List, Tuple, Dict, Optional, Any, Set
 
 logger = logging.getLogger(__name__)
 
+# Name prefixes of hidden files on Unix and Office lock files on Windows
+HIDDEN_FILE_PREFIXES = ('.', '~$')
+
+# Errors from os.copy_file_range that mean "not supported here", not a failed copy
+_COPY_RANGE_FALLBACK_ERRNOS = {
+    errno.EXDEV, errno.ENOSYS, errno.EINVAL, errno.EOPNOTSUPP, errno.EBADF, errno.ETXTBSY
+}
+
 class FileOperations:
     """Handles file operations such as moving, copying, and backing up files."""
     
@@ -17,22 +27,45 @@ class FileOperations:
         self.backup_dir = None
     
     def move_file(self, source_path: str, dest_path: str, 
-                 preserve_timestamps: bool = True) -> bool:
+                 preserve_timestamps: bool = True,
+                 same_device: Optional[bool] = None,
+                 raise_errors: bool = False) -> bool:
         """Move a file from source to destination.
         
+        Same-device moves are a plain rename, which keeps the original
+        timestamps without restoring them explicitly.
+        
         Args:
             source_path: Path to the source file
             dest_path: Path to the destination
             preserve_timestamps: Whether to preserve original timestamps
+            same_device: Whether source and destination are on the same
+                filesystem. When None it is detected and the destination
+                directory is created if needed; when given, the destination
+                directory must already exist.
+            raise_errors: Whether to raise the error instead of logging it
+                and returning False, so the caller can report it
             
         Returns:
             True if successful, False otherwise
         """
         try:
-            # Ensure destination directory exists
-            dest_dir = os.path.dirname(dest_path)
-            if not os.path.exists(dest_dir):
-                os.makedirs(dest_dir)
+            if same_device is None:
+                # Ensure destination directory exists
+                dest_dir = os.path.dirname(dest_path)
+                if not os.path.exists(dest_dir):
+                    os.makedirs(dest_dir)
+                same_device = os.stat(source_path).st_dev == os.stat(dest_dir).st_dev
+            
+            if same_device:
+                try:
+                    os.rename(source_path, dest_path)
+                    logger.debug(f"Moved {source_path} to {dest_path}")
+                    return True
+                except OSError as e:
+                    # Fall back to a copying move across filesystems
+                    if e.errno != errno.EXDEV:
+                        raise
             
             # Store original timestamps if needed
             if preserve_timestamps:
@@ -46,37 +79,66 @@ class FileOperations:
             if preserve_timestamps:
                 os.utime(dest_path, (atime, mtime))
             
-            logger.info(f"Moved {source_path} to {dest_path}")
+            logger.debug(f"Moved {source_path} to {dest_path}")
             return True
             
         except Exception as e:
+            if raise_errors:
+                raise
             logger.error(f"Error moving file {source_path}: {e}")
             return False
     
-    def handle_duplicate(self, dest_path: str) -> str:
+    def handle_duplicate(self, dest_path: str, 
+                         existing_names: Optional[Set[str]] = None) -> str:
         """Handle duplicate filenames by adding a number suffix.
         
         Args:
-            dest_path: The destination path that already exists
+            dest_path: The destination path that may already exist
+            existing_names: Optional set of names already in the destination
+                directory, as returned by scan_existing_names. When given it is
+                probed instead of the filesystem and the chosen name is added to it.
             
         Returns:
             A new destination path that doesn't exist
         """
-        if not os.path.exists(dest_path):
-            return dest_path
-            
         directory, filename = os.path.split(dest_path)
-        name, ext = os.path.splitext(filename)
         
-        counter = 1
-        new_path = dest_path
+        if existing_names is None:
+            existing_names = self.scan_existing_names(directory)
+        
+        new_filename = filename
+        if new_filename.casefold() in existing_names:
+            name, ext = os.path.splitext(filename)
+            counter = 1
+            while True:
+                new_filename = f"{name}_{counter}{ext}"
+                if new_filename.casefold() not in existing_names:
+                    break
+                counter += 1
         
-        while os.path.exists(new_path):
-            new_filename = f"{name}_{counter}{ext}"
-            new_path = os.path.join(directory, new_filename)
-            counter += 1
+        existing_names.add(new_filename.casefold())
+        if new_filename == filename:
+            return dest_path
+        return os.path.join(directory, new_filename)
+    
+    def scan_existing_names(self, directory: str) -> Set[str]:
+        """Collect the names of all entries in a directory with one scan.
+        
+        Names are casefolded on every platform, so a name that differs only
+        in case counts as taken. On a case-insensitive filesystem such as
+        macOS's default APFS, renaming onto it would replace the existing file.
+        
+        Args:
+            directory: Directory to scan
             
-        return new_path
+        Returns:
+            Set of casefolded entry names, empty if the directory doesn't exist
+        """
+        try:
+            with os.scandir(directory) as entries:
+                return {entry.name.casefold() for entry in entries}
+        except FileNotFoundError:
+            return set()
     
     def create_backup(self, source_dir: str) -> Optional[str]:
         """Create a backup of files before sorting.
@@ -96,10 +158,13 @@ class FileOperations:
             if not os.path.exists(backup_path):
                 os.makedirs(backup_path)
             
-            # Copy all files (not directories) to the backup
-            for item in os.scandir(source_dir):
-                if item.is_file():
-                    shutil.copy2(item.path, backup_path)
+            # Copy all files (not directories) to the backup in parallel
+            with os.scandir(source_dir) as entries:
+                jobs = [(item.path, os.path.join(backup_path, item.name))
+                        for item in entries if item.is_file()]
+            with ThreadPoolExecutor(max_workers=8) as executor:
+                # Consume the results so the first copy error is raised here
+                list(executor.map(lambda job: self.copy_file(*job), jobs))
             
             self.backup_dir = backup_path
             logger.info(f"Created backup at {backup_path}")
@@ -109,6 +174,39 @@ class FileOperations:
             logger.error(f"Error creating backup: {e}")
             return None
     
+    def copy_file(self, source_path: str, dest_path: str):
+        """Copy a file's contents and metadata, like shutil.copy2.
+        
+        Uses os.copy_file_range where available so the kernel copies the data
+        (or reflinks it on filesystems that support it), falling back to
+        shutil.copyfile, which itself uses sendfile on Linux.
+        
+        Args:
+            source_path: Path to the source file
+            dest_path: Path to the destination file
+        """
+        copy_file_range = getattr(os, "copy_file_range", None)
+        copied = False
+        
+        if copy_file_range is not None:
+            try:
+                with open(source_path, 'rb') as fsrc, open(dest_path, 'wb') as fdst:
+                    remaining = os.fstat(fsrc.fileno()).st_size
+                    while remaining > 0:
+                        count = copy_file_range(fsrc.fileno(), fdst.fileno(), remaining)
+                        if count == 0:
+                            break
+                        remaining -= count
+                # A copy that stopped short is redone by shutil.copyfile below
+                copied = remaining == 0
+            except OSError as e:
+                if e.errno not in _COPY_RANGE_FALLBACK_ERRNOS:
+                    raise
+        
+        if not copied:
+            shutil.copyfile(source_path, dest_path)
+        shutil.copystat(source_path, dest_path)
+    
     def restore_from_backup(self) -> bool:
         """Restore files from the last backup.
         
@@ -146,4 +244,4 @@ class FileOperations:
             True if the file is a system or hidden file, False otherwise
         """
         # Simple check for hidden files on Windows and Unix
-        return filename.startswith('.') or filename.startswith('~$')
+        return filename.startswith(HIDDEN_FILE_PREFIXES)
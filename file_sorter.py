@@ -9,21 +9,38 @@ import sys
 import shutil
 import logging
 import json
+import queue
 import threading
-import time
 import tkinter as tk
+from concurrent.futures import ThreadPoolExecutor
 from tkinter import ttk, filedialog, messagebox
 from datetime import datetime
 from typing import Dict, List, Tuple, Set, Optional, Any
 
 # Import custom modules
-from file_operations import FileOperations
+from file_operations import FileOperations, HIDDEN_FILE_PREFIXES
 from file_categories import FileCategories
 from gui_components import (
     ModernProgressFrame, ModernLogFrame, ModernStatsFrame,
-    ModernFolderSelector, ModernOptionsFrame, ModernActionButtons
+    ModernFolderSelector, ModernOptionsFrame, ModernActionButtons, SortUIBus
 )
 
+# Use orjson for preferences when available, stdlib json otherwise
+try:
+    import orjson
+    
+    def _json_loads(data: bytes) -> Any:
+        return orjson.loads(data)
+    
+    def _json_dumps(obj: Any) -> bytes:
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2)
+except ImportError:
+    def _json_loads(data: bytes) -> Any:
+        return json.loads(data)
+    
+    def _json_dumps(obj: Any) -> bytes:
+        return json.dumps(obj, indent=2).encode("utf-8")
+
 # Configure logging
 logging.basicConfig(
     level=logging.INFO,
@@ -32,6 +49,9 @@ logging.basicConfig(
 )
 logger = logging.getLogger(__name__)
 
+# Number of per-file log lines grouped into one log entry while sorting
+LOG_BATCH_SIZE = 100
+
 class FileSorterApp:
     """Main application class for the File Sorter."""
     
@@ -71,8 +91,8 @@ class FileSorterApp:
         """Load user preferences from file if it exists."""
         try:
             if os.path.exists(self.user_prefs_file):
-                with open(self.user_prefs_file, 'r') as f:
-                    prefs = json.load(f)
+                with open(self.user_prefs_file, 'rb') as f:
+                    prefs = _json_loads(f.read())
                     
                 # Apply custom categories if defined
                 if 'custom_categories' in prefs:
@@ -94,8 +114,8 @@ class FileSorterApp:
                 'custom_categories': self.categories.get_custom_categories()
             }
             
-            with open(self.user_prefs_file, 'w') as f:
-                json.dump(prefs, f, indent=4)
+            with open(self.user_prefs_file, 'wb') as f:
+                f.write(_json_dumps(prefs))
                 
             logger.info("User preferences saved successfully")
         except Exception as e:
@@ -167,6 +187,33 @@ class FileSorterApp:
         )
         status_bar.pack(side=tk.BOTTOM, fill=tk.X)
         
+        # Progress and statistics updates from the sorting thread
+        self.ui_bus = SortUIBus(self.root, self.progress_frame, self.stats_frame)
+        
+        # Queue of log and status updates posted by the sorting thread,
+        # drained on the Tk thread
+        self.ui_queue = queue.Queue()
+        self.root.after(50, self._drain_ui_queue)
+        
+    def _drain_ui_queue(self):
+        """Apply all pending log and status updates posted by worker threads.
+        
+        Runs on the Tk main thread about 20 times per second.
+        """
+        try:
+            while True:
+                kind, *args = self.ui_queue.get_nowait()
+                
+                if kind == "log":
+                    self.log_frame.add_log_entry(*args)
+                elif kind == "status":
+                    self.status_var.set(args[0])
+        except queue.Empty:
+            pass
+        finally:
+            # Re-arm even if an update fails, so one error doesn't stop the drain
+            self.root.after(50, self._drain_ui_queue)
+        
     def browse_folder(self):
         """Open a dialog to select a folder."""
         folder = filedialog.askdirectory(title="Select Folder to Sort")
@@ -219,91 +266,126 @@ class FileSorterApp:
         
         try:
             # Reset statistics and progress
-            self.stats_frame.reset_stats()
-            self.progress_frame.reset()
+            self.ui_bus.reset()
+            
+            # Pass 1: stream the directory listing and categorize every file from
+            # its name alone, without keeping the DirEntry objects around
+            total_files = 0
+            skipped = []
+            file_names = []
+            with os.scandir(folder) as entries:
+                for file_entry in entries:
+                    if not file_entry.is_file():
+                        continue
+                    total_files += 1
+                    
+                    # Skip hidden/system files
+                    if file_entry.name.startswith(HIDDEN_FILE_PREFIXES):
+                        skipped.append(file_entry.name)
+                        continue
+                    
+                    file_names.append(file_entry.name)
             
-            # Get all files in the directory
-            files = [f for f in os.scandir(folder) if f.is_file()]
-            total_files = len(files)
+            # Determine categories based on extension in one batch
+            file_categories = self.categories.categorize_batch(file_names)
+            cat_paths = {category: os.path.join(folder, category)
+                         for category in set(file_categories)}
             
             if total_files == 0:
-                self.log_message("No files found in the selected folder")
+                self.post_log_message("No files found in the selected folder")
                 self.is_sorting = False
-                self.status_var.set("Ready")
+                self.ui_queue.put(("status", "Ready"))
                 return
                 
-            self.log_message(f"Starting to {'analyze' if is_preview else 'sort'} {total_files} files")
-            self.progress_frame.set_maximum(total_files)
+            self.post_log_message(f"Starting to {'analyze' if is_preview else 'sort'} {total_files} files")
+            self.ui_bus.set_maximum(total_files)
+            
+            # Per-file messages are posted in batches rather than one by one
+            log_buffer = []
+            
+            def buffer_log(message):
+                log_buffer.append(message)
+                if len(log_buffer) >= LOG_BATCH_SIZE:
+                    self.post_log_batch(log_buffer)
+                    log_buffer.clear()
+            
+            for file_name in skipped:
+                buffer_log(f"Skipping system/hidden file: {file_name}")
             
-            # Track operations for undo functionality
+            # Track operations for undo functionality, and preview counts per category
             operations = []
-            stats = {category: 0 for category in self.categories.get_all_categories()}
+            stats = self.categories.get_empty_stats()
             
-            # Process each file
-            for i, file_entry in enumerate(files):
+            # Create the used category folders and scan each one once for existing names
+            assigned_names = {}
+            if not is_preview:
+                for category, category_path in cat_paths.items():
+                    os.makedirs(category_path, exist_ok=True)
+                    assigned_names[category] = self.file_ops.scan_existing_names(category_path)
+            
+            # Plan each move; duplicate names are assigned here so moves are independent
+            plans = []
+            for file_name, category in zip(file_names, file_categories):
                 if not self.is_sorting:  # Check if sorting was cancelled
                     break
-                    
-                file_path = file_entry.path
-                file_name = file_entry.name
-                
-                # Skip hidden/system files
-                if file_name.startswith('.') or file_name.startswith('~$'):
-                    self.log_message(f"Skipping system/hidden file: {file_name}")
-                    continue
-                
-                # Determine category based on extension
-                category = self.categories.get_category_for_file(file_name)
                 
-                # Create category folder if needed
-                category_path = os.path.join(folder, category)
-                if not os.path.exists(category_path) and not is_preview:
-                    os.makedirs(category_path)
-                
-                # Determine destination path
-                dest_path = os.path.join(category_path, file_name)
-                
-                # Handle duplicate filenames
-                if os.path.exists(dest_path) and not is_preview:
-                    base_name, ext = os.path.splitext(file_name)
-                    counter = 1
-                    while os.path.exists(dest_path):
-                        new_name = f"{base_name}_{counter}{ext}"
-                        dest_path = os.path.join(category_path, new_name)
-                        counter += 1
+                # Determine destination path, handling duplicate filenames; the category
+                # folder is already joined, so plain concatenation is enough
+                dest_path = cat_paths[category] + os.sep + file_name
+                if not is_preview:
+                    dest_path = self.file_ops.handle_duplicate(dest_path, assigned_names[category])
                 
                 # Log the operation
                 operation_type = "Would move" if is_preview else "Moving"
-                self.log_message(f"{operation_type} {file_name} to {category}")
+                buffer_log(f"{operation_type} {file_name} to {category}")
                 
-                # Actually move the file if not in preview mode
-                if not is_preview:
-                    try:
-                        # Store original timestamp for restoration
-                        stat_info = os.stat(file_path)
-                        atime, mtime = stat_info.st_atime, stat_info.st_mtime
-                        
-                        # Move the file
-                        shutil.move(file_path, dest_path)
-                        
-                        # Restore original timestamps
-                        os.utime(dest_path, (atime, mtime))
-                        
-                        # Record operation for undo
-                        operations.append((dest_path, file_path))
-                    except Exception as e:
-                        self.log_message(f"Error moving {file_name}: {e}", level=logging.ERROR)
-                        continue
+                if is_preview:
+                    stats[category] += 1
+                else:
+                    plans.append((os.path.join(folder, file_name), dest_path, category))
+            
+            if log_buffer:
+                self.post_log_batch(log_buffer)
+                log_buffer.clear()
+            
+            # Everything not waiting to be moved is already processed
+            processed = total_files - len(plans)
+            self.ui_bus.tick(processed, stats)
+            
+            # Pass 2: move the files on a thread pool; each move is an independent rename
+            lock = threading.Lock()
+            
+            def move_planned(plan):
+                nonlocal processed
+                if not self.is_sorting:  # Check if sorting was cancelled
+                    return
                 
-                # Update statistics
-                stats[category] += 1
-                self.stats_frame.update_category_count(category, stats[category])
+                file_path, dest_path, category = plan
                 
-                # Update progress
-                self.progress_frame.update_progress(i + 1)
+                # Category folders live inside the source folder, so this is a plain
+                # rename; move_file falls back to a copying move on EXDEV
+                try:
+                    self.file_ops.move_file(file_path, dest_path, same_device=True,
+                                            raise_errors=True)
+                    error = None
+                except Exception as e:
+                    error = e
                 
-                # Small delay to prevent UI freezing
-                time.sleep(0.01)
+                with lock:
+                    processed += 1
+                    if error is None:
+                        # Record operation for undo and update statistics and progress
+                        operations.append((dest_path, file_path))
+                        self.ui_bus.tick(processed, {category: 1})
+                    else:
+                        self.post_log_message(f"Error moving {os.path.basename(file_path)}: {error}",
+                                              level=logging.ERROR)
+                        self.ui_bus.tick(processed)
+            
+            if plans:
+                max_workers = min(32, (os.cpu_count() or 1) * 4)
+                with ThreadPoolExecutor(max_workers=max_workers) as executor:
+                    list(executor.map(move_planned, plans))
             
             # Save the operations for undo functionality if not in preview mode
             if not is_preview and operations:
@@ -311,17 +393,18 @@ class FileSorterApp:
                 
             # Final log message
             mode_text = "Preview completed" if is_preview else "Sorting completed"
-            self.log_message(f"✅ {mode_text}. Processed {total_files} files.")
+            self.post_log_message(f"✅ {mode_text}. Processed {total_files} files.")
             
             # Update UI
-            self.status_var.set("✨ Ready")
+            self.ui_queue.put(("status", "✨ Ready"))
             
         except Exception as e:
-            self.log_message(f"❌ Error during sorting: {e}", level=logging.ERROR)
-            self.status_var.set("❌ Error occurred")
+            self.post_log_message(f"❌ Error during sorting: {e}", level=logging.ERROR)
+            self.ui_queue.put(("status", "❌ Error occurred"))
             
         finally:
             self.is_sorting = False
+            self.ui_bus.finish()
     
     def undo_last_operation(self):
         """Undo the last sorting operation."""
@@ -381,6 +464,38 @@ class FileSorterApp:
         # Log to UI
         self.log_frame.add_log_entry(message, level)
     
+    def post_log_message(self, message, level=logging.INFO):
+        """Log a message from a worker thread.
+        
+        The UI entry is queued and added by the Tk main thread.
+        
+        Args:
+            message: The message to log
+            level: The logging level
+        """
+        # Log to file
+        logger.log(level, message)
+        
+        # Queue for the UI
+        self.ui_queue.put(("log", message, level))
+    
+    def post_log_batch(self, messages):
+        """Log a batch of per-file messages from a worker thread.
+        
+        The batch goes to the log file as a single DEBUG record and to the UI
+        as a single entry, so only summaries appear in the log file at INFO.
+        
+        Args:
+            messages: The messages to log, one per line
+        """
+        text = "\n".join(messages)
+        
+        # Log to file
+        logger.debug(text)
+        
+        # Queue for the UI
+        self.ui_queue.put(("log", text, logging.INFO))
+    
     def clear_log(self):
         """Clear the log display."""
         self.log_frame.clear_log()
@@ -4,8 +4,101 @@ Contains custom GUI components for the File Sorter application with modern desig
 """
 import tkinter as tk
 from tkinter import ttk
+from tkinter import font as tkfont
 import logging
-from typing import Dict, List, Optional
+import threading
+import time
+from collections import deque
+from itertools import groupby
+from operator import itemgetter
+from contextlib import contextmanager
+from typing import Dict, List, Optional, Set
+
+# Map logging levels to log text tag names
+_LEVEL_TAGS = {
+    logging.INFO: "INFO",
+    logging.WARNING: "WARNING",
+    logging.ERROR: "ERROR",
+    logging.DEBUG: "DEBUG"
+}
+
+# Font specs, registered once as named Tk fonts by _register_fonts()
+_FONTS = {
+    "FSSectionHeader": ("Segoe UI", 10, "bold"),
+    "FSValue": ("Segoe UI", 12, "bold"),
+    "FSCategoryLabel": ("Segoe UI", 9),
+    "FSCategoryValue": ("Segoe UI", 10, "bold"),
+    "FSFolderLabel": ("Segoe UI", 11, "bold"),
+    "FSFolderEntry": ("Segoe UI", 10),
+    "FSLog": ("Consolas", 9),
+    "FSLogBold": ("Consolas", 9, "bold"),
+    "FSLogSmall": ("Consolas", 8)
+}
+
+# Activity log colors
+_LOG_BG = "#f8f9fa"
+_LOG_FG = "#212529"
+_LOG_ACCENT = "#007bff"
+_LOG_SELECT_FG = "white"
+_LOG_TAG_STYLES = {
+    "INFO": ("#28a745", "FSLog"),
+    "WARNING": ("#ffc107", "FSLogBold"),
+    "ERROR": ("#dc3545", "FSLogBold"),
+    "DEBUG": ("#6c757d", "FSLogSmall"),
+    "SUCCESS": ("#28a745", "FSLogBold")
+}
+
+# Named font objects; Tk deletes a named font when its Font object is collected
+_named_fonts: Dict[str, tkfont.Font] = {}
+
+
+def _register_fonts(widget: tk.Misc):
+    """Create the named fonts in _FONTS once per process.
+    
+    Widgets then refer to fonts by name, so Tk parses each spec only once.
+    
+    Args:
+        widget: Any widget of the Tk application
+    """
+    if _named_fonts:
+        return
+    for name, spec in _FONTS.items():
+        _named_fonts[name] = tkfont.Font(widget, font=spec, name=name)
+
+
+# Last formatted log timestamp as [epoch second, "HH:MM:SS"]
+_ts_cache = [0, ""]
+
+
+def _timestamp() -> str:
+    """Get the current local time as HH:MM:SS.
+    
+    The string is only reformatted when the wall-clock second changes.
+    
+    Returns:
+        The formatted timestamp
+    """
+    now = int(time.time())
+    if now != _ts_cache[0]:
+        _ts_cache[0] = now
+        _ts_cache[1] = time.strftime("%H:%M:%S", time.localtime(now))
+    return _ts_cache[1]
+
+
+# Icons for the default categories, in display order
+_CATEGORY_ICONS = {
+    "Images": "🖼️",
+    "Videos": "🎥",
+    "Audio": "🎵",
+    "Documents": "📄",
+    "PDFs": "📕",
+    "Executables": "⚙️",
+    "Compressed": "📦",
+    "Spreadsheets": "📊",
+    "Presentations": "📋",
+    "Code": "💻",
+    "Others": "📁"
+}
 
 class ModernProgressFrame(ttk.LabelFrame):
     """A modern frame containing a progress bar and percentage label."""
@@ -17,6 +110,7 @@ class ModernProgressFrame(ttk.LabelFrame):
             parent: The parent widget
         """
         super().__init__(parent, text="📊 Progress", padding="15")
+        _register_fonts(self)
         
         # Create main container
         container = ttk.Frame(self)
@@ -38,12 +132,19 @@ class ModernProgressFrame(ttk.LabelFrame):
         percentage_label = ttk.Label(
             container, 
             textvariable=self.percentage_var,
-            font=("Segoe UI", 12, "bold")
+            font="FSValue"
         )
         percentage_label.pack(side=tk.RIGHT)
         
         # Set initial maximum value
         self.maximum = 100
+        
+        # Last percentage shown, to skip formatting when it hasn't changed
+        self._last_pct = 0
+        
+        # Redraws are coalesced and flushed at most about 30 times per second
+        self._dirty = False
+        self._scheduled = False
     
     def set_maximum(self, value: int):
         """Set the maximum value for the progress bar.
@@ -64,17 +165,42 @@ class ModernProgressFrame(ttk.LabelFrame):
         self.progress_var.set(value)
         
         # Calculate and update percentage
-        percentage = min(100, int((value / self.maximum) * 100))
-        self.percentage_var.set(f"{percentage}%")
-        
-        # Update the UI
-        self.update()
+        percentage = value * 100 // self.maximum
+        if percentage > 100:
+            percentage = 100
+        if percentage != self._last_pct:
+            self._last_pct = percentage
+            self.percentage_var.set(f"{percentage}%")
+        
+        # Schedule a redraw
+        self._schedule_flush()
     
     def reset(self):
         """Reset the progress bar to zero."""
         self.progress_var.set(0)
-        self.percentage_var.set("0%")
-        self.update()
+        if self._last_pct:
+            self._last_pct = 0
+            self.percentage_var.set("0%")
+        self._schedule_flush()
+    
+    def force_flush(self):
+        """Redraw pending progress changes immediately."""
+        self._dirty = False
+        self.update_idletasks()
+    
+    def _schedule_flush(self):
+        """Mark the display dirty and schedule a redraw if none is pending."""
+        self._dirty = True
+        if not self._scheduled:
+            self._scheduled = True
+            self.after(33, self._flush)
+    
+    def _flush(self):
+        """Redraw pending progress changes; runs from the after() timer."""
+        self._scheduled = False
+        if self._dirty:
+            self._dirty = False
+            self.update_idletasks()
 
 
 class ModernStatsFrame(ttk.LabelFrame):
@@ -87,6 +213,7 @@ class ModernStatsFrame(ttk.LabelFrame):
             parent: The parent widget
         """
         super().__init__(parent, text="📈 Statistics", padding="15")
+        _register_fonts(self)
         
         # Create main container with grid layout
         self.container = ttk.Frame(self)
@@ -98,32 +225,44 @@ class ModernStatsFrame(ttk.LabelFrame):
         self.container.columnconfigure(2, weight=1)
         self.container.columnconfigure(3, weight=1)
         
-        # Create header row
-        header_style = ("Segoe UI", 10, "bold")
-        
         # Total files section
         total_frame = ttk.Frame(self.container)
         total_frame.grid(row=0, column=0, columnspan=2, sticky=tk.EW, padx=10, pady=5)
         
-        ttk.Label(total_frame, text="📁 Total Files:", font=header_style).pack(side=tk.LEFT)
+        ttk.Label(total_frame, text="📁 Total Files:", font="FSSectionHeader").pack(side=tk.LEFT)
         self.total_files_var = tk.StringVar(value="0")
-        ttk.Label(total_frame, textvariable=self.total_files_var, font=("Segoe UI", 12, "bold")).pack(side=tk.LEFT, padx=(5, 0))
+        ttk.Label(total_frame, textvariable=self.total_files_var, font="FSValue").pack(side=tk.LEFT, padx=(5, 0))
         
         # Files processed section
         processed_frame = ttk.Frame(self.container)
         processed_frame.grid(row=0, column=2, columnspan=2, sticky=tk.EW, padx=10, pady=5)
         
-        ttk.Label(processed_frame, text="✅ Processed:", font=header_style).pack(side=tk.LEFT)
+        ttk.Label(processed_frame, text="✅ Processed:", font="FSSectionHeader").pack(side=tk.LEFT)
         self.processed_files_var = tk.StringVar(value="0")
-        ttk.Label(processed_frame, textvariable=self.processed_files_var, font=("Segoe UI", 12, "bold")).pack(side=tk.LEFT, padx=(5, 0))
+        ttk.Label(processed_frame, textvariable=self.processed_files_var, font="FSValue").pack(side=tk.LEFT, padx=(5, 0))
         
         # Category counts container
         self.categories_frame = ttk.Frame(self.container)
         self.categories_frame.grid(row=1, column=0, columnspan=4, sticky=tk.EW, padx=10, pady=10)
         
-        # Category counts (will be added dynamically)
+        # Category counts, with rows for the default categories created up front
         self.category_vars = {}
         self.next_row = 0
+        self.begin_add_categories()
+        for category in _CATEGORY_ICONS:
+            self._add_category_row(category)
+        self.end_add_categories()
+        
+        # Running totals, so the processed count never re-reads the StringVars
+        self._category_counts: Dict[str, int] = {}
+        self._total_processed = 0
+        
+        # Categories changed inside batch_updates(), shown when the batch ends
+        self._batch_depth = 0
+        self._pending_categories: Set[str] = set()
+        
+        # Text last written to each of this frame's variables, keyed by name
+        self._shown_text: Dict[str, str] = {}
     
     def update_total_files(self, count: int):
         """Update the total files count.
@@ -131,7 +270,7 @@ class ModernStatsFrame(ttk.LabelFrame):
         Args:
             count: The total number of files
         """
-        self.total_files_var.set(str(count))
+        self._set_text(self.total_files_var, str(count))
     
     def update_processed_files(self, count: int):
         """Update the processed files count.
@@ -139,64 +278,241 @@ class ModernStatsFrame(ttk.LabelFrame):
         Args:
             count: The number of processed files
         """
-        self.processed_files_var.set(str(count))
+        self._set_text(self.processed_files_var, str(count))
     
     def update_category_count(self, category: str, count: int):
         """Update the count for a specific category.
         
+        Inside batch_updates() the display is only refreshed when the batch ends.
+        
         Args:
             category: The category name
             count: The number of files in this category
         """
-        # Create category variable if it doesn't exist
-        if category not in self.category_vars:
-            row = self.next_row // 2
-            col = self.next_row % 2
-            
-            # Create category frame
-            cat_frame = ttk.Frame(self.categories_frame)
-            cat_frame.grid(row=row, column=col, sticky=tk.EW, padx=5, pady=2)
-            
-            # Category icon mapping
-            icons = {
-                "Images": "🖼️",
-                "Documents": "📄",
-                "Videos": "🎥",
-                "Audio": "🎵",
-                "Archives": "📦",
-                "Code": "💻",
-                "Spreadsheets": "📊",
-                "Presentations": "📋",
-                "Other": "📁"
-            }
-            icon = icons.get(category, "📁")
-            
-            # Create label for category
-            ttk.Label(cat_frame, text=f"{icon} {category}:", font=("Segoe UI", 9)).pack(side=tk.LEFT)
-            
-            # Create variable for count
-            self.category_vars[category] = tk.StringVar(value="0")
-            ttk.Label(cat_frame, textvariable=self.category_vars[category], font=("Segoe UI", 10, "bold")).pack(side=tk.LEFT, padx=(5, 0))
-            
-            self.next_row += 1
+        self._total_processed += count - self._category_counts.get(category, 0)
+        self._category_counts[category] = count
+        
+        if self._batch_depth:
+            self._pending_categories.add(category)
+            return
         
         # Update the count
-        self.category_vars[category].set(str(count))
+        self._show_category_count(category)
         
         # Update processed files count
-        total_processed = sum(int(var.get()) for var in self.category_vars.values())
-        self.update_processed_files(total_processed)
+        self.update_processed_files(self._total_processed)
+    
+    @contextmanager
+    def batch_updates(self):
+        """Coalesce category count updates into a single refresh.
+        
+        Counts set inside the block are written to the display once on exit,
+        followed by one update_idletasks(). Batches may be nested.
+        """
+        self._batch_depth += 1
+        try:
+            yield self
+        finally:
+            self._batch_depth -= 1
+            if not self._batch_depth:
+                for category in self._pending_categories:
+                    self._show_category_count(category)
+                self._pending_categories.clear()
+                self.update_processed_files(self._total_processed)
+                self.update_idletasks()
+    
+    def begin_add_categories(self):
+        """Suspend size propagation of the category grid while rows are added.
+        
+        Pair with end_add_categories() so the layout is recomputed only once.
+        """
+        self.categories_frame.grid_propagate(False)
+    
+    def end_add_categories(self):
+        """Resume size propagation of the category grid and lay it out once."""
+        self.categories_frame.grid_propagate(True)
+        self.categories_frame.update_idletasks()
+    
+    def _set_text(self, var: tk.StringVar, text: str):
+        """Set one of this frame's variables unless it already shows this text.
+        
+        Skips the trace callbacks and redraw that setting an unchanged value
+        would still trigger.
+        
+        Args:
+            var: The variable to set
+            text: The new text
+        """
+        name = str(var)
+        if self._shown_text.get(name) == text:
+            return
+        self._shown_text[name] = text
+        var.set(text)
+    
+    def _show_category_count(self, category: str):
+        """Display the current count for a category.
+        
+        Args:
+            category: The category name
+        """
+        var = self.category_vars.get(category)
+        if var is None:
+            # Custom categories get their row on first use
+            self.begin_add_categories()
+            var = self._add_category_row(category)
+            self.end_add_categories()
+        self._set_text(var, str(self._category_counts[category]))
+    
+    def _add_category_row(self, category: str) -> tk.StringVar:
+        """Add the label and count row for a category.
+        
+        Args:
+            category: The category name
+            
+        Returns:
+            The variable holding the displayed count
+        """
+        row = self.next_row // 2
+        col = self.next_row % 2
+        
+        # Create category frame
+        cat_frame = ttk.Frame(self.categories_frame)
+        cat_frame.grid(row=row, column=col, sticky=tk.EW, padx=5, pady=2)
+        
+        icon = _CATEGORY_ICONS.get(category, "📁")
+        
+        # Create label for category
+        ttk.Label(cat_frame, text=f"{icon} {category}:", font="FSCategoryLabel").pack(side=tk.LEFT)
+        
+        # Create variable for count
+        var = self.category_vars[category] = tk.StringVar(value="0")
+        ttk.Label(cat_frame, textvariable=var, font="FSCategoryValue").pack(side=tk.LEFT, padx=(5, 0))
+        
+        self.next_row += 1
+        return var
     
     def reset_stats(self):
         """Reset all statistics to zero."""
-        self.processed_files_var.set("0")
+        self._category_counts.clear()
+        self._pending_categories.clear()
+        self._total_processed = 0
+        self._set_text(self.processed_files_var, "0")
         for var in self.category_vars.values():
-            var.set("0")
+            self._set_text(var, "0")
+
+
+class SortUIBus:
+    """Carries progress and category counts from a worker thread to the UI.
+    
+    Worker threads report through the thread-safe tick(), reset(),
+    set_maximum() and finish() methods. The buffered state is applied to the
+    progress and statistics frames on the Tk thread in one pass per timer tick.
+    Code already running on the Tk thread, such as the folder scan setting
+    the total file count, may still call those frames directly.
+    """
+    
+    def __init__(self, widget: tk.Misc, progress_frame: ModernProgressFrame,
+                 stats_frame: ModernStatsFrame, interval: int = 33):
+        """Initialize the bus and start its flush timer.
+        
+        Args:
+            widget: Any widget of the Tk application, used for scheduling
+            progress_frame: The progress frame to update
+            stats_frame: The statistics frame to update
+            interval: Milliseconds between flushes
+        """
+        self.widget = widget
+        self.progress_frame = progress_frame
+        self.stats_frame = stats_frame
+        self.interval = interval
+        
+        # State shared with worker threads, guarded by the lock
+        self._lock = threading.Lock()
+        self._reset_pending = False
+        self._maximum: Optional[int] = None
+        self._progress: Optional[int] = None
+        self._counts: Dict[str, int] = {}
+        self._dirty_categories: Set[str] = set()
+        self._finished = False
+        
+        self.widget.after(self.interval, self._flush)
+    
+    def reset(self):
+        """Clear the progress and statistics, dropping any unapplied updates."""
+        with self._lock:
+            self._reset_pending = True
+            self._maximum = None
+            self._progress = None
+            self._counts.clear()
+            self._dirty_categories.clear()
+            self._finished = False
+    
+    def set_maximum(self, value: int):
+        """Set the maximum value for the progress bar.
+        
+        Args:
+            value: The maximum value
+        """
+        with self._lock:
+            self._maximum = value
+    
+    def tick(self, progress: Optional[int] = None,
+             category_delta: Optional[Dict[str, int]] = None):
+        """Record new progress and/or additions to category counts.
+        
+        Args:
+            progress: The current progress value, if it changed
+            category_delta: Number of files to add to each category's count
+        """
+        with self._lock:
+            if progress is not None:
+                self._progress = progress
+            if category_delta:
+                for category, delta in category_delta.items():
+                    if delta:
+                        self._counts[category] = self._counts.get(category, 0) + delta
+                        self._dirty_categories.add(category)
+    
+    def finish(self):
+        """Mark the operation finished so the final state is drawn right away."""
+        with self._lock:
+            self._finished = True
+    
+    def _flush(self):
+        """Apply the buffered state to the frames; runs from the after() timer."""
+        with self._lock:
+            reset_pending, self._reset_pending = self._reset_pending, False
+            maximum, self._maximum = self._maximum, None
+            progress, self._progress = self._progress, None
+            counts = {category: self._counts[category] for category in self._dirty_categories}
+            self._dirty_categories.clear()
+            finished, self._finished = self._finished, False
+        
+        # Re-arm even if applying fails, so one error doesn't freeze the display
+        try:
+            if reset_pending:
+                self.stats_frame.reset_stats()
+                self.progress_frame.reset()
+            if maximum is not None:
+                self.progress_frame.set_maximum(maximum)
+            if counts:
+                with self.stats_frame.batch_updates():
+                    for category, count in counts.items():
+                        self.stats_frame.update_category_count(category, count)
+            if progress is not None:
+                self.progress_frame.update_progress(progress)
+            if finished:
+                self.progress_frame.force_flush()
+        finally:
+            self.widget.after(self.interval, self._flush)
 
 
 class ModernLogFrame(ttk.LabelFrame):
     """A modern frame displaying log messages."""
     
+    # Oldest lines are dropped beyond this many to bound memory and redraw cost
+    MAX_LINES = 5000
+    
     def __init__(self, parent):
         """Initialize the log frame.
         
@@ -204,6 +520,7 @@ class ModernLogFrame(ttk.LabelFrame):
             parent: The parent widget
         """
         super().__init__(parent, text="📝 Activity Log", padding="15")
+        _register_fonts(self)
         
         # Create main container
         container = ttk.Frame(self)
@@ -215,12 +532,12 @@ class ModernLogFrame(ttk.LabelFrame):
             height=12, 
             width=80, 
             wrap=tk.WORD,
-            font=("Consolas", 9),
-            bg="#f8f9fa",
-            fg="#212529",
-            insertbackground="#007bff",
-            selectbackground="#007bff",
-            selectforeground="white"
+            font="FSLog",
+            bg=_LOG_BG,
+            fg=_LOG_FG,
+            insertbackground=_LOG_ACCENT,
+            selectbackground=_LOG_ACCENT,
+            selectforeground=_LOG_SELECT_FG
         )
         
         scrollbar = ttk.Scrollbar(container, orient=tk.VERTICAL, command=self.log_text.yview)
@@ -231,50 +548,86 @@ class ModernLogFrame(ttk.LabelFrame):
         self.log_text.pack(side=tk.LEFT, fill=tk.BOTH, expand=True)
         
         # Configure tags for different log levels with modern colors
-        self.log_text.tag_configure("INFO", foreground="#28a745", font=("Consolas", 9))
-        self.log_text.tag_configure("WARNING", foreground="#ffc107", font=("Consolas", 9, "bold"))
-        self.log_text.tag_configure("ERROR", foreground="#dc3545", font=("Consolas", 9, "bold"))
-        self.log_text.tag_configure("DEBUG", foreground="#6c757d", font=("Consolas", 8))
-        self.log_text.tag_configure("SUCCESS", foreground="#28a745", font=("Consolas", 9, "bold"))
+        for tag, (color, font) in _LOG_TAG_STYLES.items():
+            self.log_text.tag_configure(tag, foreground=color, font=font)
         
         # Make text widget read-only
         self.log_text.configure(state=tk.DISABLED)
+        
+        # Entries waiting to be inserted by the next flush
+        self._log_queue = deque()
+        self._log_scheduled = False
+        
+        # Line count of each displayed entry, oldest first, so trimming needs
+        # no queries to the Text widget
+        self._entry_lines = deque()
+        self._line_count = 0
     
     def add_log_entry(self, message: str, level=logging.INFO):
         """Add a new log entry to the log display.
         
+        Entries are queued and inserted together every 50 ms.
+        
         Args:
             message: The log message
             level: The logging level
         """
         # Map logging level to tag name
-        level_tags = {
-            logging.INFO: "INFO",
-            logging.WARNING: "WARNING",
-            logging.ERROR: "ERROR",
-            logging.DEBUG: "DEBUG"
-        }
-        tag = level_tags.get(level, "INFO")
+        tag = _LEVEL_TAGS.get(level, "INFO")
+        
+        # Queue with a timestamp taken now, not at flush time
+        timestamp = _timestamp()
+        self._log_queue.append((timestamp, message, tag))
+        
+        if not self._log_scheduled:
+            self._log_scheduled = True
+            self.after(50, self._flush_log)
+    
+    def _flush_log(self):
+        """Insert all queued log entries; runs from the after() timer."""
+        self._log_scheduled = False
+        if not self._log_queue:
+            return
+        
+        # Only follow new entries if the user hasn't scrolled up to read history
+        at_bottom = self.log_text.yview()[1] >= 0.999
         
         # Enable text widget for editing
         self.log_text.configure(state=tk.NORMAL)
         
-        # Add timestamp and message
-        import datetime
-        timestamp = datetime.datetime.now().strftime("%H:%M:%S")
-        entry = f"[{timestamp}] {message}\n"
-        
-        # Insert with appropriate tag
-        self.log_text.insert(tk.END, entry, tag)
+        # Insert runs of same-tag entries as one pre-joined chunk each
+        entries = list(self._log_queue)
+        self._log_queue.clear()
+        for tag, group in groupby(entries, key=itemgetter(2)):
+            chunk = []
+            for timestamp, message, _ in group:
+                chunk.append(f"[{timestamp}] {message}\n")
+                lines = message.count("\n") + 1
+                self._entry_lines.append(lines)
+                self._line_count += lines
+            self.log_text.insert(tk.END, "".join(chunk), tag)
+        
+        # Drop whole entries from the top once past the line cap, keeping the newest
+        dropped = 0
+        while self._line_count > self.MAX_LINES and len(self._entry_lines) > 1:
+            lines = self._entry_lines.popleft()
+            self._line_count -= lines
+            dropped += lines
+        if dropped:
+            self.log_text.delete('1.0', f'{dropped + 1}.0')
         
         # Scroll to the end
-        self.log_text.see(tk.END)
+        if at_bottom:
+            self.log_text.see(tk.END)
         
         # Disable text widget again
         self.log_text.configure(state=tk.DISABLED)
     
     def clear_log(self):
         """Clear all log entries."""
+        self._log_queue.clear()
+        self._entry_lines.clear()
+        self._line_count = 0
         self.log_text.configure(state=tk.NORMAL)
         self.log_text.delete(1.0, tk.END)
         self.log_text.configure(state=tk.DISABLED)
@@ -291,13 +644,14 @@ class ModernFolderSelector(ttk.Frame):
             command: Callback function when folder is selected
         """
         super().__init__(parent)
+        _register_fonts(self)
         
         # Create main container
         container = ttk.Frame(self)
         container.pack(fill=tk.X, expand=True)
         
         # Folder icon and label
-        ttk.Label(container, text="📁 Source Folder:", font=("Segoe UI", 11, "bold")).pack(side=tk.LEFT, padx=(0, 10))
+        ttk.Label(container, text="📁 Source Folder:", font="FSFolderLabel").pack(side=tk.LEFT, padx=(0, 10))
         
         # Entry field
         self.folder_var = tk.StringVar()
@@ -305,7 +659,7 @@ class ModernFolderSelector(ttk.Frame):
             container, 
             textvariable=self.folder_var, 
             width=50,
-            font=("Segoe UI", 10)
+            font="FSFolderEntry"
         )
         self.entry.pack(side=tk.LEFT, fill=tk.X, expand=True, padx=(0, 10))
         